@@ -300,7 +300,7 @@ def generateReductionSpec(
     yamlObject["calibBlock"] = calibBlocks
 
     with open(output, "w") as f:
-        yaml.dump(yamlObject, f, sort_keys=False)
+        yaml.dump(yamlObject, f, Dumper=yaml.CSafeDumper, sort_keys=False)
 
 
 def getSpecInitSpec(dirName: str) -> Dict[str, Any]:
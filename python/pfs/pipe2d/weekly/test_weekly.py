@@ -18,6 +18,27 @@ weeklyRaw = None
 weeklyRerun = None
 
 
+def sumByGroup(values, order, starts, stops):
+    """Sum values within groups of contiguous sorted elements
+
+    Parameters
+    ----------
+    values : `numpy.ndarray`
+        Values to sum.
+    order : `numpy.ndarray` of `int`
+        Indices that sort ``values`` into groups.
+    starts, stops : `numpy.ndarray` of `int`
+        Start and stop (exclusive) of each group in the sorted ``values``.
+
+    Returns
+    -------
+    sums : `numpy.ndarray`
+        Sum of ``values`` for each group.
+    """
+    cumulative = np.concatenate(([0], np.cumsum(values[order])))
+    return cumulative[stops] - cumulative[starts]
+
+
 @classParameters(configuration=("brn", "bmn"))
 class ProductionTestCase(lsst.utils.tests.TestCase):
     def setUp(self):
@@ -37,19 +58,15 @@ class ProductionTestCase(lsst.utils.tests.TestCase):
             self.assertTrue(self.butler.datasetExists("pfsMerged", visit=visit))
             self.assertTrue(self.butler.datasetExists("pfsMergedLsf", visit=visit))
             config = self.butler.get("pfsConfig", visit=visit).select(spectrograph=1)
-            for target in config:
-                if target.catId == -1:
-                    # Not a real target that we've processed
-                    continue
+            # Skip fibers that are not real targets that we've processed
+            for target in config[config.catId != -1]:
                 self.assertTrue(self.butler.datasetExists("pfsSingle", target.identity, visit=visit))
                 self.assertTrue(self.butler.datasetExists("pfsSingleLsf", target.identity, visit=visit))
 
     def testObjectProducts(self):
         """Test that object products exist"""
-        for target in self.design:
-            if target.catId == -1:
-                # Not a real target that we've processed
-                continue
+        # Skip fibers that are not real targets that we've processed
+        for target in self.design[self.design.catId != -1]:
             dataId = target.identity.copy()
             dataId["nVisit"] = len(self.visits)
             dataId["pfsVisitHash"] = calculatePfsVisitHash(self.visits)
@@ -63,27 +80,32 @@ class ProductionTestCase(lsst.utils.tests.TestCase):
             spectra = self.butler.get("pfsMerged", visit=visit)
             lsf = self.butler.get("pfsMergedLsf", visit=visit)
             badMask = spectra.flags.get("NO_DATA", "BAD_FLAT", "INTRP")
-            for fiberId, target in zip(config.fiberId, config):
-                if target.catId == -1:
-                    # Not a real target that we've processed
-                    continue
-                with self.subTest(visit=visit, fiberId=fiberId):
-                    index = np.where(spectra.fiberId == fiberId)[0]
-                    mask = spectra.mask[index]
-                    select = (mask & badMask) == 0
-
-                    self.assertGreater(select.sum(), 0.75*len(mask), "Too many masked pixels")
-                    self.assertFalse(np.all(spectra.sky[index][select] == 0))
-                    self.assertTrue(np.all(spectra.variance[index][select] > 0))
-                    self.assertIn(fiberId, lsf)
-                    self.assertIsInstance(lsf[fiberId], Lsf)
+            good = (spectra.mask & badMask) == 0
+            # Skip fibers that are not real targets that we've processed
+            fiberIds = config.fiberId[config.catId != -1]
+            # Group rows by fiberId once, rather than scanning spectra.fiberId for every fiber
+            order = np.argsort(spectra.fiberId, kind="stable")
+            sortedFiberId = spectra.fiberId[order]
+            starts = np.searchsorted(sortedFiberId, fiberIds, side="left")
+            stops = np.searchsorted(sortedFiberId, fiberIds, side="right")
+
+            numRows = stops - starts
+            numGood = sumByGroup(good.sum(axis=1), order, starts, stops)
+            numSky = sumByGroup((good & (spectra.sky != 0)).sum(axis=1), order, starts, stops)
+            numBadVariance = sumByGroup((good & ~(spectra.variance > 0)).sum(axis=1), order, starts, stops)
+
+            with self.subTest(visit=visit):
+                self.assertEqual(fiberIds[numGood <= 0.75*numRows].tolist(), [], "Too many masked pixels")
+                self.assertEqual(fiberIds[numSky == 0].tolist(), [], "Sky is all zero")
+                self.assertEqual(fiberIds[numBadVariance > 0].tolist(), [], "Non-positive variance")
+                self.assertEqual([fiberId for fiberId in fiberIds if fiberId not in lsf], [], "Missing LSF")
+                self.assertEqual([fiberId for fiberId in fiberIds if not isinstance(lsf[fiberId], Lsf)], [],
+                                 "LSF is not an Lsf")
 
     def testObjects(self):
         """Test that object files can be read, and they are reasonable"""
-        for target in self.design:
-            if target.catId == -1:
-                # Not a real target that we've processed
-                continue
+        # Skip fibers that are not real targets that we've processed
+        for target in self.design[self.design.catId != -1]:
             dataId = target.identity.copy()
             dataId.update(nVisit=len(self.visits), pfsVisitHash=calculatePfsVisitHash(self.visits))
             with self.subTest(**dataId):
@@ -125,13 +147,19 @@ class ArcTestCase(lsst.utils.tests.TestCase):
             fitWavelength = detMap.findWavelength(lines.fiberId, lines.y)
             good = ~lines.flag & (lines.status == 0) & (lines.description != "Trace")
             sigNoise = lines.flux/lines.fluxErr
+            use = good & (sigNoise > minSigNoise)
+            # Sort the usable lines by fiberId so that each fiber is a contiguous slice
+            order = np.argsort(lines.fiberId[use], kind="stable")
+            fiberIds = lines.fiberId[use][order]
+            residuals = (lines.wavelength[use] - fitWavelength[use])[order]
             for fiberId in set(lines.fiberId):
                 with self.subTest(visit=self.visit, arm=arm, fiberId=fiberId):
-                    select = (lines.fiberId == fiberId) & good & (sigNoise > minSigNoise)
-                    num = select.sum()
+                    start = np.searchsorted(fiberIds, fiberId, side="left")
+                    stop = np.searchsorted(fiberIds, fiberId, side="right")
+                    num = stop - start
                     self.assertGreater(num, 7)
 
-                    residual = lines.wavelength[select] - fitWavelength[select]
+                    residual = residuals[start:stop]
                     lq, median, uq = np.percentile(residual, (25.0, 50.0, 75.0))
                     robustRms = 0.741*(uq - lq)
 
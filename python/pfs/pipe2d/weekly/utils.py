@@ -1,13 +1,19 @@
 from .. import generateCommands
 
+import functools
 import os
-import re
 
 __all__ = ("getIdValues", "getVisitsByBlockName", "getBrnVisits", "getBmnVisits")
 
+WEEKLY_YAML = os.path.normpath(
+    os.path.join(os.path.dirname(__file__), "..", "..", "..", "..", "examples", "weekly.yaml")
+)
+"""Path to the weekly processing specification (`str`).
+"""
 
-def getIdValues(text):
-    """Interpret a list of values
+
+def _iterIdValues(text):
+    """Iterate over a list of values
 
     The list of values is in the same format as they would be specified on
     the command-line, without any leading keyword (e.g., no ``visit=``).
@@ -17,28 +23,88 @@ def getIdValues(text):
 
     Parameters
     ----------
-    text : `list` of `str`
-        Text with the list of visits.
+    text : iterable of `str`
+        Text with the list of visits, one or more lines. An open file may be
+        passed directly; it is read line by line.
+
+    Yields
+    ------
+    visit : `int`
+        Visit number.
+    """
+    for line in text:
+        for vv in line.strip().split("^"):
+            # Syntax is "first", "first..last" or "first..last:step"
+            first, sep, rest = vv.partition("..")
+            if sep:
+                last, sep, step = rest.partition(":")
+                if not sep:
+                    step = "1"
+                if not all(ss.isascii() and ss.isdigit() for ss in (first, last, step)):
+                    raise ValueError(f"Invalid visit range: {vv!r}")
+                yield from range(int(first), int(last) + 1, int(step))
+            else:
+                yield int(first)
+
+
+def getIdValues(text):
+    """Interpret a list of values
+
+    The list of values is in the same format as they would be specified on
+    the command-line, without any leading keyword (e.g., no ``visit=``).
+
+    Parameters
+    ----------
+    text : iterable of `str`
+        Text with the list of visits, one or more lines.
 
     Returns
     -------
     visits : `list` of `int`
         Visit numbers.
     """
-    visits = []
-    for line in text:
-        for vv in line.strip().split("^"):
-            mat = re.search(r"^(\d+)\.\.(\d+)(?::(\d+))?$", vv)
-            if mat:
-                v1 = int(mat.group(1))
-                v2 = int(mat.group(2))
-                v3 = mat.group(3)
-                v3 = int(v3) if v3 else 1
-                for ii in range(v1, v2 + 1, v3):
-                    visits.append(ii)
-            else:
-                visits.append(int(vv))
-    return visits
+    return list(_iterIdValues(text))
+
+
+@functools.lru_cache(maxsize=None)
+def _getIdValuesCached(idStr):
+    """Cached version of `getIdValues` for a single string
+
+    Parameters
+    ----------
+    idStr : `str`
+        Text with the list of visits.
+
+    Returns
+    -------
+    visits : `tuple` of `int`
+        Visit numbers.
+    """
+    return tuple(getIdValues([idStr]))
+
+
+@functools.lru_cache(maxsize=4)
+def _processYamlCached(filename, mtime):
+    """Cached version of ``generateCommands.processYaml``
+
+    Parameters
+    ----------
+    filename : `str`
+        Path to a YAML file.
+    mtime : `float`
+        Modification time of ``filename``; part of the cache key so that
+        the file is re-read if it changes.
+
+    Returns
+    -------
+    initSource : `InitSource`
+        Initial calibs.
+    calibBlocks : `dict` [`str`, `CalibBlock`]
+        Mapping from block names to CalibBlock.
+    scienceBlocks : `dict` [`str`, `ScienceBlock`]
+        Mapping from block names to ScienceBlock.
+    """
+    return generateCommands.processYaml(filename)
 
 
 def getVisitsByBlockName(blockName):
@@ -54,15 +120,14 @@ def getVisitsByBlockName(blockName):
     visits : `list` of `int`
         Visit numbers.
     """
-    filename = os.path.join(os.path.dirname(__file__), "..", "..", "..", "..", "examples", "weekly.yaml")
-    initSource, calibBlocks, scienceBlocks = generateCommands.processYaml(filename)
+    initSource, calibBlocks, scienceBlocks = _processYamlCached(WEEKLY_YAML, os.path.getmtime(WEEKLY_YAML))
     idList = scienceBlocks[blockName].source.id
     if not (len(idList) != 0 and idList[0].startswith("visit=")):
         raise RuntimeError(
             f"examples/weekly.yaml: 'id' field of scienceBlock '{blockName}' must be 'visit=...'")
 
     idStr = idList[0][len("visit="):]
-    return getIdValues([idStr])
+    return list(_getIdValuesCached(idStr))
 
 
 def getBrnVisits():
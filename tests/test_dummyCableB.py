@@ -21,7 +21,8 @@ class DummyCableBTestCase(lsst.utils.tests.TestCase):
         """Test python interface"""
         pfsDesignId = {}
         # Not testing all possible combinations, as that would take too long.
-        combinations = sum((list(itertools.combinations(self.db.names, nn)) for nn in range(1, 4)), [])
+        combinations = itertools.chain.from_iterable(itertools.combinations(self.db.names, nn)
+                                                     for nn in range(1, 4))
         for names in combinations:
             ident = self.db.getHash(*names)
             # Test uniqueness of different combinations of setups
@@ -29,8 +30,9 @@ class DummyCableBTestCase(lsst.utils.tests.TestCase):
             pfsDesignId[ident] = set(names)
 
             # Test that ordering is unimportant
+            # The first permutation is ``names`` itself, which we've just done.
             fiberIds = self.db.getFiberIds(*names)
-            for nn in itertools.permutations(names, len(names)):
+            for nn in itertools.islice(itertools.permutations(names, len(names)), 1, None):
                 self.assertEqual(self.db.getHash(*nn), ident)
                 self.assertFloatsEqual(self.db.getFiberIds(*nn), fiberIds)
 
@@ -0,0 +1,55 @@
+import lsst.utils.tests
+
+from pfs.pipe2d.weekly.utils import getIdValues
+from pfs.drp.stella.tests import runTests
+
+display = None
+
+
+class GetIdValuesTestCase(lsst.utils.tests.TestCase):
+    """Test pfs.pipe2d.weekly.utils.getIdValues"""
+    def testAccepted(self):
+        """Test the accepted forms of visit lists"""
+        for text, expect in (
+            (["5"], [5]),
+            (["1..5"], [1, 2, 3, 4, 5]),
+            (["1..10:3"], [1, 4, 7, 10]),
+            (["1..3^7^10..20:5"], [1, 2, 3, 7, 10, 15, 20]),
+            (["5..1"], []),
+            (["1..2\n", " 7 \n"], [1, 2, 7]),
+        ):
+            with self.subTest(text=text):
+                self.assertEqual(getIdValues(text), expect)
+
+    def testRejected(self):
+        """Test that malformed visit lists are rejected"""
+        for text in (
+            "",
+            "abc",
+            "1^^2",
+            "5..1:-1",
+            "1..10:-2",
+            "-2..2",
+            "1 ..3",
+            "1..3: 2",
+            "1..3:",
+            "1..3:0",
+            "1..3:2:1",
+            "1..",
+            "..3",
+        ):
+            with self.subTest(text=text):
+                with self.assertRaises(ValueError):
+                    getIdValues([text])
+
+
+class TestMemory(lsst.utils.tests.MemoryTestCase):
+    pass
+
+
+def setup_module(module):
+    lsst.utils.tests.init()
+
+
+if __name__ == "__main__":
+    runTests(globals())